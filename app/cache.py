@@ -0,0 +1,63 @@
+"""Redis read-through cache for issue API responses.
+
+Cached values are the serialized JSON response bodies, so a cache hit can be
+returned to the client without touching Postgres or re-serializing anything.
+Cache failures are logged and treated as misses, never as request errors.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+REDIS_CACHE_URL = os.getenv("REDIS_CACHE_URL", "redis://localhost:6379/2")
+CACHE_TTL_SECONDS = 60
+# A slow or unreachable Redis must fail fast and fall through to Postgres
+CACHE_TIMEOUT_SECONDS = float(os.getenv("REDIS_CACHE_TIMEOUT", "0.25"))
+
+ISSUE_LIST_KEY = "issues:list:v1"
+
+# Shared connection pool for this process
+_REDIS = redis.Redis.from_url(
+    REDIS_CACHE_URL,
+    socket_connect_timeout=CACHE_TIMEOUT_SECONDS,
+    socket_timeout=CACHE_TIMEOUT_SECONDS,
+)
+
+
+def issue_key(issue_id) -> str:
+    """Cache key for a single issue."""
+    return f"issue:{issue_id}"
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """Return the cached value for key, or None on a miss or Redis error."""
+    try:
+        return await _REDIS.get(key)
+    except redis.RedisError:
+        logger.warning("Cache read failed", extra={"key": key}, exc_info=True)
+        return None
+
+
+async def set_cached(key: str, value, ttl: int = CACHE_TTL_SECONDS) -> None:
+    """Store value under key with a TTL."""
+    try:
+        await _REDIS.set(key, value, ex=ttl)
+    except redis.RedisError:
+        logger.warning("Cache write failed", extra={"key": key}, exc_info=True)
+
+
+async def invalidate_issues(*issue_ids) -> None:
+    """Drop the cached issue list and the given issues in a single DEL."""
+    try:
+        await _REDIS.delete(ISSUE_LIST_KEY, *(issue_key(issue_id) for issue_id in issue_ids))
+    except redis.RedisError:
+        logger.warning("Cache invalidation failed", extra={"issue_ids": issue_ids}, exc_info=True)
+
+
+async def close_cache() -> None:
+    """Close the shared Redis connection pool. Call once on shutdown."""
+    await _REDIS.aclose()
@@ -3,10 +3,22 @@ Celery application initialization and configuration.
 This module sets up Celery to use Redis as the message broker.
 """
 
+import asyncio
 import os
+from typing import Optional
+
+import httpx
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 from kombu import Exchange, Queue
 
+from app.llm_service import create_http_client
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 # Get configuration from environment variables
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
@@ -20,41 +32,129 @@ app = Celery(
 
 # Configure task settings
 app.conf.update(
-    # Task serialization
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # Task serialization: compact binary msgpack, gzip-compressed on the broker
+    task_serializer="msgpack",
+    accept_content=["json", "msgpack"],  # Still accept JSON messages already queued
+    result_serializer="msgpack",
+    task_compression="gzip",
     timezone="UTC",
     enable_utc=True,
     
     # Task execution
     task_track_started=True,  # Track when task starts
+    task_ignore_result=True,  # Tasks write their results to the DB, nobody reads AsyncResult
+    result_expires=3600,  # Keep stored results (debug_task only) for 1 hour
     task_time_limit=30 * 60,  # Kill task after 30 minutes
     task_soft_time_limit=25 * 60,  # Soft limit 25 minutes (allows graceful cleanup)
     
     # Retry behavior
     task_acks_late=True,  # Task acknowledged after execution
+    task_acks_on_failure_or_timeout=True,  # Ack failed tasks too (retries are explicit)
     worker_prefetch_multiplier=1,  # Prefetch one task at a time
+    worker_disable_rate_limits=True,  # No rate limits are used, skip the bookkeeping
+    broker_connection_retry_on_startup=True,  # Keep retrying if Redis is not up yet
     
-    # Task routes and queues
+    # Task routes and queues: the I/O-bound LLM tasks get their own queue so
+    # they can be served by a dedicated, high-concurrency worker
     task_routes={
-        "app.tasks.celery_tasks.enrich_issue": {"queue": "issues"},
+        "app.tasks.celery_tasks.enrich_issue": {"queue": "enrichment"},
+        "app.tasks.celery_tasks.enrich_issues_batch": {"queue": "enrichment"},
+        "app.tasks.celery_tasks.notify_enriched": {"queue": "notifications"},
     },
+    task_default_queue="default",
     task_queues=[
         Queue("default", Exchange("default"), routing_key="default"),
-        Queue("issues", Exchange("issues"), routing_key="issues"),
+        # Transient: a lost enrichment can be re-run, so skip persisting messages
+        Queue(
+            "enrichment",
+            Exchange("enrichment", delivery_mode="transient"),
+            routing_key="enrichment",
+            durable=False,
+        ),
+        Queue(
+            "notifications",
+            Exchange("notifications", delivery_mode="transient"),
+            routing_key="notifications",
+            durable=False,
+        ),
     ],
 )
 
-# Auto-discover tasks from all registered apps
-app.autodiscover_tasks(["app"])
 
-# Explicitly import task modules to ensure they're registered
-# This is necessary for Celery to discover tasks with @app.task decorators
-from app.tasks import celery_tasks  # noqa: E402, F401
+@app.on_after_finalize.connect
+def _import_task_modules(sender, **kwargs):
+    """
+    Explicitly import task modules so their @app.task functions are registered.
+
+    Runs once the app configuration is finalized instead of scanning the whole
+    package with autodiscover_tasks() on every worker start.
+    """
+    from app.tasks import celery_tasks  # noqa: F401
+
+
+# Per-process resources for tasks that run async code. They are created in
+# worker_process_init, i.e. after the prefork pool has forked the child, and are
+# reused by every task the process runs: the HTTP client and the async DB engine
+# keep their connections bound to the loop that opened them.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_HTTP: Optional[httpx.AsyncClient] = None
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    return uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """Create the event loop and LLM HTTP client for this worker process."""
+    from app.database.config import engine
+
+    global _LOOP, _HTTP
+    # Drop any pooled connections inherited from the parent across the fork,
+    # without closing them; the parent still owns those sockets
+    engine.sync_engine.dispose(close=False)
+    _LOOP = _new_event_loop()
+    _HTTP = create_http_client()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    """
+    Close the HTTP clients, cache and database connections and the event loop.
+
+    Also runs when a child is recycled by --max-tasks-per-child or
+    --max-memory-per-child, so replaced processes do not leak sockets.
+    """
+    from app.cache import close_cache
+    from app.database.config import engine
+    from app.tasks.notifications import close_notification_client
+
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    if _HTTP is not None:
+        _LOOP.run_until_complete(_HTTP.aclose())
+    _LOOP.run_until_complete(close_notification_client())
+    _LOOP.run_until_complete(close_cache())
+    _LOOP.run_until_complete(engine.dispose())
+    _LOOP.close()
+
+
+def run_async(coro):
+    """Run a coroutine on this worker process's persistent event loop."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        # Solo pool or eager mode, where worker_process_init is not sent
+        _LOOP = _new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    """Return this worker process's HTTP client, if one was created."""
+    return _HTTP
 
 
-@app.task(bind=True)
+@app.task(bind=True, ignore_result=False)
 def debug_task(self):
     """Debug task for testing Celery setup."""
     print(f"Request: {self.request!r}")
@@ -1,15 +1,60 @@
-from sqlalchemy import Column, Enum, String
+from sqlalchemy import Column, Index, SmallInteger, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.types import TypeDecorator
+from uuid6 import uuid7
+
 from app.database.config import Base
+from app.schemas import IssuePriority, IssueStatus
+
+
+class SmallIntEnum(TypeDecorator):
+    """Store a string Enum as a SMALLINT code, in member declaration order.
+
+    Values are bound from either the enum member or its string value and are
+    returned as the plain string value. Only ever append new members to the
+    enum, reordering them would change the meaning of stored codes.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._values = tuple(member.value for member in enum_class)
+        self._codes = {value: code for code, value in enumerate(self._values)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value).value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._values[value]
 
 
 class Issue(Base):
     __tablename__ = "issues"
 
-    id = Column(String, primary_key=True, index=True)
+    # UUIDv7 keys are time-ordered, so new rows land on the rightmost B-tree page
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String)
     description = Column(String)
-    status = Column(Enum("open", "closed", name="issue_status"))
-    priority = Column(Enum("low", "medium", "high", name="issue_priority"))
+    status = Column(SmallIntEnum(IssueStatus))
+    priority = Column(SmallIntEnum(IssuePriority))
 
     ai_summary = Column(String, nullable=True)
-    tags = Column(String, nullable=True)
\ No newline at end of file
+    tags = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_issues_status", status),
+        # Partial covering index for open-issue lists, answerable by an index-only scan
+        Index(
+            "ix_issues_open",
+            id,
+            postgresql_where=(status == IssueStatus.OPEN),
+            postgresql_include=["title", "priority"],
+        ),
+    )
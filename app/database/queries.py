@@ -0,0 +1,27 @@
+"""Issue queries shared by the API routes.
+
+Statements are built once at import and reused with bound parameters, so
+each request skips rebuilding the Core expression.
+
+ORM queries load issues with raiseload("*"): any relationship added to Issue
+later must be loaded eagerly (selectinload) by the query that needs it, and
+an accidental per-row lazy load raises instead of silently issuing N+1
+queries.
+"""
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import raiseload
+
+from app.database import models
+
+# Loader options for every ORM query and Session.get() on Issue
+ISSUE_LOAD_OPTIONS = [raiseload("*")]
+
+# Plain column rows for the list endpoint, no ORM instances at all
+LIST_ISSUES_STMT = select(models.Issue.__table__)
+
+GET_ISSUES_BATCH_STMT = (
+    select(models.Issue)
+    .where(models.Issue.id.in_(bindparam("issue_ids", expanding=True)))
+    .options(*ISSUE_LOAD_OPTIONS)
+)
@@ -1,14 +0,0 @@
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from app.database import engine, Base
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # Startup
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    yield
-    
-    # Shutdown
-    await engine.dispose()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Exact-match Redis cache for LLM enrichment results."""
+
+import hashlib
+import logging
+from typing import Optional
+
+import orjson
+
+from app.cache import get_cached, set_cached
+from app.llm_service import EnrichmentResult
+
+logger = logging.getLogger(__name__)
+
+LLM_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+class LLMCache:
+    """
+    Cache LLM enrichments keyed on a hash of (model, title, description).
+
+    Identical issues, such as duplicate bug reports, reuse one LLM answer
+    instead of spending another round trip and tokens. Hit and miss counts
+    are kept per worker process for observability.
+    """
+
+    def __init__(self, ttl: int = LLM_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(model: str, title: str, description: str) -> str:
+        """Build the cache key for an enrichment request."""
+        payload = orjson.dumps(
+            {"title": title, "description": description, "model": model},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return "llm:" + hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def _decode(cached: bytes) -> EnrichmentResult:
+        """Parse a cached value, raising ValueError if malformed."""
+        return EnrichmentResult.from_dict(orjson.loads(cached))
+
+    async def get(self, key: str) -> Optional[EnrichmentResult]:
+        """
+        Return the cached enrichment for key, or None on a miss.
+
+        A malformed or old-format entry is logged and counted as a miss, so
+        the caller asks the LLM again and overwrites it.
+        """
+        cached = await get_cached(key)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        try:
+            result = self._decode(cached)
+        except ValueError:
+            logger.warning("Ignoring malformed LLM cache entry", extra={"key": key}, exc_info=True)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return result
+
+    async def set(self, key: str, result: EnrichmentResult, ttl: Optional[int] = None) -> None:
+        """Store an enrichment under key."""
+        await set_cached(
+            key,
+            orjson.dumps({"summary": result.summary, "tags": result.tags}),
+            ttl=ttl or self.ttl,
+        )
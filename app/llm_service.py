@@ -1,14 +1,34 @@
+import asyncio
 import logging
-import json
 import os
 from typing import Optional
 from dataclasses import dataclass
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """Create a keep-alive HTTP/2 client for talking to LLM APIs."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+# Shared HTTP client so connections to the LLM API are reused between calls
+# instead of paying DNS, TCP and TLS setup on every enrichment
+_CLIENT = create_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Call once on application or worker shutdown."""
+    await _CLIENT.aclose()
+
+
 @dataclass
 class EnrichmentResult:
     """
@@ -18,6 +38,23 @@ class EnrichmentResult:
     summary: str
     tags: list[str]
 
+    @classmethod
+    def from_dict(cls, data: object) -> "EnrichmentResult":
+        """
+        Build a result from a parsed {"summary": ..., "tags": [...]} object.
+
+        Raises:
+            ValueError: If data is not a dict with a string summary and a list of string tags
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Enrichment is not a JSON object")
+        summary, tags = data.get("summary"), data.get("tags")
+        if not isinstance(summary, str):
+            raise ValueError("Enrichment summary is not a string")
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("Enrichment tags are not a list of strings")
+        return cls(summary=summary, tags=tags)
+
 
 class LLMServiceError(Exception):
     """Custom exception for LLM service errors."""
@@ -28,6 +65,9 @@ class LLMServiceError(Exception):
 class LLMService:
     """Abstract base for LLM services."""
 
+    # Model identifier, part of the LLM cache key
+    model: str = ""
+
     async def enrich(self, title: str, description: str) -> EnrichmentResult:
         """
         Enrich issue with AI summary and tags.
@@ -44,27 +84,115 @@ class LLMService:
         """
         raise NotImplementedError
 
+    async def enrich_many(self, issues: list[tuple[str, str]]) -> list[EnrichmentResult]:
+        """
+        Enrich several issues at once.
+
+        Services that can handle several issues in one request should override
+        this. The default runs one enrich() call per issue concurrently.
+
+        Args:
+            issues: List of (title, description) pairs
+
+        Returns:
+            EnrichmentResult for each issue, in input order
+
+        Raises:
+            LLMServiceError: If enrichment fails
+        """
+        return list(await asyncio.gather(*(self.enrich(title, description) for title, description in issues)))
+
 
 class OpenAIService(LLMService):
     """
     Implementation of LLMService using OpenAI API.
     """
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
+    system_prompt = """You are a technical issue analyser. Analyse the given issue and provide a response.
+        
+DO NOT use markdown formatting. Return ONLY a raw JSON object with no code blocks, no backticks, and no additional text."""
+
+    batch_system_prompt = """You are a technical issue analyser. Analyse each of the given issues and provide a response.
+
+DO NOT use markdown formatting. Return ONLY a raw JSON array with no code blocks, no backticks, and no additional text."""
+
+    common_tags = "bug, feature-request, frontend, backend, documentation, performance, security, database, api, ui/ux, urgent, needs-review"
+
+    def __init__(
+        self, api_key: str, model: str = "gpt-4o", http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Intialize OpenAI Service
+
+        Uses the module-level shared HTTP client unless one is injected.
         """
         self.api_key = api_key
         self.model = model
+        self.http_client = http_client or _CLIENT
         self.base_url = "https://api.openai.com/v1"
 
+    async def _complete(self, system_prompt: str, user_prompt: str, max_tokens: int) -> str:
+        """Stream a chat completion and return its text with any markdown code fences removed."""
+
+        # Stream the completion as server-sent events so the body is read
+        # and assembled while the model is still generating
+        content_parts: list[str] = []
+        async with self.http_client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                "temperature": 0.7,
+                "max_tokens": max_tokens,
+                "stream": True,
+            },
+        ) as response:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                # Each event is "data: {chunk}", the stream ends with "data: [DONE]"
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+
+                chunk = orjson.loads(data)
+                if not chunk.get("choices"):
+                    continue
+                delta = chunk["choices"][0].get("delta") or {}
+                if delta.get("content"):
+                    content_parts.append(delta["content"])
+
+        content = "".join(content_parts)
+        logger.debug(f"OpenAI response content: {content}")
+
+        if not content:
+            logger.error("Empty content in OpenAI response")
+            raise LLMServiceError("Empty content returned from OpenAI")
+
+        # Strip markdown code blocks if present
+        content = content.strip()
+        if content.startswith("```"):
+            # Remove markdown code block markers
+            content = content.split("```")[1]
+            if content.startswith("json"):
+                content = content[4:]  # Remove 'json' language identifier
+            content = content.strip()
+
+        return content
+
     async def enrich(self, title: str, description: str) -> EnrichmentResult:
         """Call OpenAI to generate summary and tags"""
 
-        system_prompt = """You are a technical issue analyser. Analyse the given issue and provide a response.
-        
-DO NOT use markdown formatting. Return ONLY a raw JSON object with no code blocks, no backticks, and no additional text."""
-
         user_prompt = f"""Analyse this issue and respond with ONLY valid JSON (no markdown):
 
 Title: {title}
@@ -76,58 +204,20 @@ Respond with this exact JSON format:
   "tags": ["tag1", "tag2", "tag3"]
 }}
 
-Common tags: bug, feature-request, frontend, backend, documentation, performance, security, database, api, ui/ux, urgent, needs-review"""
+Common tags: {self.common_tags}"""
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt},
-                        ],
-                        "temperature": 0.7,
-                        "max_tokens": 250,
-                    },
-                )
-                response.raise_for_status()
-
-                result = response.json()
-                logger.debug(f"OpenAI response: {result}")
-                
-                if not result.get("choices") or not result["choices"][0].get("message"):
-                    logger.error(f"Unexpected OpenAI response structure: {result}")
-                    raise LLMServiceError("Invalid response structure from OpenAI")
-                
-                content = result["choices"][0]["message"]["content"]
-                
-                if not content:
-                    logger.error("Empty content in OpenAI response")
-                    raise LLMServiceError("Empty content returned from OpenAI")
-
-                # Strip markdown code blocks if present
-                content = content.strip()
-                if content.startswith("```"):
-                    # Remove markdown code block markers
-                    content = content.split("```")[1]
-                    if content.startswith("json"):
-                        content = content[4:]  # Remove 'json' language identifier
-                    content = content.strip()
-
-                # Parse JSON response
-                parsed = json.loads(content)
-
-                return EnrichmentResult(summary=parsed["summary"], tags=parsed["tags"])
-
-        except json.JSONDecodeError as e:
+            content = await self._complete(self.system_prompt, user_prompt, max_tokens=250)
+
+            # Parse JSON response
+            return EnrichmentResult.from_dict(orjson.loads(content))
+
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse OpenAI response: {str(e)}, raw content was: {content if 'content' in locals() else 'N/A'}")
             raise LLMServiceError(f"Invalid JSON response from OpenAI: {str(e)}")
+        except ValueError as e:
+            logger.error(f"Malformed OpenAI response: {str(e)}, raw content was: {content if 'content' in locals() else 'N/A'}")
+            raise LLMServiceError(f"Malformed response from OpenAI: {str(e)}")
         except httpx.HTTPError as e:
             logger.error(f"OpenAI API request failed: {str(e)}")
             raise LLMServiceError(f"OpenAI API error: {str(e)}")
@@ -135,8 +225,64 @@ Common tags: bug, feature-request, frontend, backend, documentation, performance
             logger.error(f"Unexpected error during OpenAI enrichment: {str(e)}")
             raise LLMServiceError(f"Unexpected error: {str(e)}")
 
+    async def enrich_many(self, issues: list[tuple[str, str]]) -> list[EnrichmentResult]:
+        """Call OpenAI once to generate summaries and tags for several issues"""
+
+        if len(issues) == 1:
+            return [await self.enrich(*issues[0])]
+
+        issues_json = orjson.dumps(
+            [
+                {"id": index, "title": title, "description": description}
+                for index, (title, description) in enumerate(issues)
+            ],
+            option=orjson.OPT_INDENT_2,
+        ).decode()
+
+        user_prompt = f"""Analyse each of these issues and respond with ONLY valid JSON (no markdown):
+
+{issues_json}
 
-def get_llm_service() -> Optional[LLMService]:
+Respond with a JSON array containing one object per issue, using the issue's id, in this exact format:
+[
+  {{
+    "id": 0,
+    "summary": "A clear 1-2 sentence summary of the issue.",
+    "tags": ["tag1", "tag2", "tag3"]
+  }}
+]
+
+Common tags: {self.common_tags}"""
+
+        try:
+            content = await self._complete(
+                self.batch_system_prompt, user_prompt, max_tokens=250 * len(issues)
+            )
+
+            # Parse JSON response and put the results back in input order
+            parsed = {item["id"]: item for item in orjson.loads(content)}
+            if set(parsed) != set(range(len(issues))):
+                raise LLMServiceError("Batched OpenAI response does not match the requested issues")
+
+            return [EnrichmentResult.from_dict(parsed[index]) for index in range(len(issues))]
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse batched OpenAI response: {str(e)}, raw content was: {content if 'content' in locals() else 'N/A'}")
+            raise LLMServiceError(f"Invalid JSON response from OpenAI: {str(e)}")
+        except ValueError as e:
+            logger.error(f"Malformed batched OpenAI response: {str(e)}, raw content was: {content if 'content' in locals() else 'N/A'}")
+            raise LLMServiceError(f"Malformed response from OpenAI: {str(e)}")
+        except httpx.HTTPError as e:
+            logger.error(f"OpenAI API request failed: {str(e)}")
+            raise LLMServiceError(f"OpenAI API error: {str(e)}")
+        except LLMServiceError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during batched OpenAI enrichment: {str(e)}")
+            raise LLMServiceError(f"Unexpected error: {str(e)}")
+
+
+def get_llm_service(http_client: Optional[httpx.AsyncClient] = None) -> Optional[LLMService]:
     """
     Factory function to get configured LLM service.
     
@@ -144,6 +290,9 @@ def get_llm_service() -> Optional[LLMService]:
     - LLM_PROVIDER: "openai" or "anthropic"
     - OPENAI_API_KEY: API key for OpenAI
     - ANTHROPIC_API_KEY: API key for Anthropic
+
+    Args:
+        http_client: Optional HTTP client to use instead of the shared one
     
     Returns:
         LLMService instance or None if not configured
@@ -156,7 +305,7 @@ def get_llm_service() -> Optional[LLMService]:
             logger.warning("LLM_PROVIDER=openai but OPENAI_API_KEY not set")
             return None
         logger.info("Using OpenAI LLM service")
-        return OpenAIService(api_key)
+        return OpenAIService(api_key, http_client=http_client)
     
     # elif provider == "anthropic":
     #     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -1,100 +1,143 @@
 import uuid
 
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
-from sqlalchemy import select
+import orjson
+from celery import chain
+from fastapi import APIRouter, HTTPException, status, Depends, Response
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from uuid6 import uuid7
 
-from app.schemas import IssueCreate, IssueResponse, IssueUpdate
+from app.cache import ISSUE_LIST_KEY, get_cached, invalidate_issues, issue_key, set_cached
+from app.schemas import IssueBatchRequest, IssueCreate, IssueResponse, IssueUpdate
 from app.database.config import get_db
 from app.database import models
-from app.tasks import notify_issue_creation
-from app.tasks.celery_tasks import enrich_issue
+from app.database.queries import GET_ISSUES_BATCH_STMT, ISSUE_LOAD_OPTIONS, LIST_ISSUES_STMT
+from app.tasks.celery_tasks import enrich_issue, notify_enriched
 
 router = APIRouter(prefix="/api/v1/issues", tags=["issues"])
 
 
 @router.get("/", response_model=list[IssueResponse])
 async def list_issues(db: AsyncSession = Depends(get_db)):
-    """List all issues from the database."""
-    result = await db.execute(select(models.Issue))
-    return result.scalars().all()
+    """List all issues from the database.
+
+    Rows are read as plain column mappings and serialized directly, skipping
+    ORM hydration and response model validation for data that was already
+    validated on write. response_model is kept for the OpenAPI schema.
+    The serialized body is cached in Redis until an issue changes.
+    """
+    body = await get_cached(ISSUE_LIST_KEY)
+
+    if body is None:
+        result = await db.execute(LIST_ISSUES_STMT)
+        rows = [dict(row) for row in result.mappings()]
+        # default=str: asyncpg returns its own UUID type, which orjson only
+        # serializes through the fallback
+        body = orjson.dumps(rows, default=str)
+        await set_cached(ISSUE_LIST_KEY, body)
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{issue_id}", response_model=IssueResponse, status_code=status.HTTP_200_OK)
-async def get_issue(issue_id: str, db: AsyncSession = Depends(get_db)):
-    """Get issue by ID"""
-    result = await db.execute(select(models.Issue).where(models.Issue.id == issue_id))
-    issue = result.scalars().first()
- 
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found"
-        )
+async def get_issue(issue_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """Get issue by ID (read through the Redis cache)"""
+    cache_key = issue_key(issue_id)
+    body = await get_cached(cache_key)
 
-    return issue
+    if body is None:
+        issue = await db.get(models.Issue, issue_id, options=ISSUE_LOAD_OPTIONS)
+
+        if not issue:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found"
+            )
+
+        body = IssueResponse.model_validate(issue).model_dump_json()
+        await set_cached(cache_key, body)
+
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/batch", response_model=list[IssueResponse], status_code=status.HTTP_200_OK)
+async def get_issues_batch(payload: IssueBatchRequest, db: AsyncSession = Depends(get_db)):
+    """Get several issues by ID in a single query. Unknown IDs are skipped."""
+    result = await db.execute(GET_ISSUES_BATCH_STMT, {"issue_ids": payload.ids})
+    return result.scalars().all()
 
 
 @router.post("/", response_model=IssueResponse, status_code=status.HTTP_201_CREATED)
 async def create_issue(
     payload: IssueCreate, 
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """Create new issue"""
-    new_issue = models.Issue(
-        id=str(uuid.uuid4()),
-        title=payload.title,
-        description=payload.description,
-        priority=payload.priority.value,
-        status="open",
+    # RETURNING hands back the inserted row, no refresh round trip needed
+    result = await db.execute(
+        insert(models.Issue)
+        .values(
+            id=uuid7(),
+            title=payload.title,
+            description=payload.description,
+            priority=payload.priority.value,
+            status="open",
+        )
+        .returning(models.Issue)
     )
-    db.add(new_issue)
+    new_issue = result.scalar_one()
     await db.commit()
-    await db.refresh(new_issue)
-
-    """Run Background Tasks - Notify on creation"""
-    background_tasks.add_task(
-        notify_issue_creation, 
-        issue = new_issue
-    )
-
-    # Queue the enrichment task to Celery
-    # The task will be picked up by a Celery worker process
-    task = enrich_issue.delay(issue_id=new_issue.id)
+    await invalidate_issues()
+
+    # Queue enrichment, then the Slack notification, to Celery. The
+    # notification receives the enriched fields from enrich_issue directly;
+    # if enrichment fails for good it is still sent, without tags
+    issue_id = str(new_issue.id)
+    unenriched = {
+        "issue_id": issue_id,
+        "title": new_issue.title,
+        "priority": new_issue.priority,
+        "description": new_issue.description,
+        "tags": None,
+    }
+    chain(
+        enrich_issue.s(issue_id).on_error(notify_enriched.si(unenriched)),
+        notify_enriched.s(),
+    ).apply_async()
     
     return new_issue
 
 
 @router.put("/{issue_id}", response_model=IssueResponse, status_code=status.HTTP_200_OK)
-async def update_issue(issue_id: str, payload: IssueUpdate, db: AsyncSession = Depends(get_db)):
+async def update_issue(issue_id: uuid.UUID, payload: IssueUpdate, db: AsyncSession = Depends(get_db)):
     """Update issue by ID"""
-    result = await db.execute(select(models.Issue).where(models.Issue.id == issue_id))
-    issue = result.scalars().first()
+    updates = payload.model_dump(exclude_none=True)
+
+    if updates:
+        # UPDATE ... RETURNING applies the change and reads the row back in one round trip
+        result = await db.execute(
+            update(models.Issue)
+            .where(models.Issue.id == issue_id)
+            .values(**updates)
+            .returning(models.Issue)
+        )
+        issue = result.scalars().first()
+    else:
+        issue = await db.get(models.Issue, issue_id, options=ISSUE_LOAD_OPTIONS)
 
     if not issue:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Issue not found"
         )
 
-    if payload.title is not None:
-        issue.title = payload.title
-    if payload.description is not None:
-        issue.description = payload.description
-    if payload.priority is not None:
-        issue.priority = payload.priority.value
-    if payload.status is not None:
-        issue.status = payload.status.value
-
     await db.commit()
-    await db.refresh(issue)
+    await invalidate_issues(issue_id)
     return issue
 
 
 @router.delete("/{issue_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_issue(issue_id: str, db: AsyncSession = Depends(get_db)):
+async def delete_issue(issue_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     """Delete issue by ID"""
-    result = await db.execute(select(models.Issue).where(models.Issue.id == issue_id))
-    issue = result.scalars().first()
+    issue = await db.get(models.Issue, issue_id, options=ISSUE_LOAD_OPTIONS)
 
     if not issue:
         raise HTTPException(
@@ -103,3 +146,4 @@ async def delete_issue(issue_id: str, db: AsyncSession = Depends(get_db)):
 
     await db.delete(issue)
     await db.commit()
+    await invalidate_issues(issue_id)
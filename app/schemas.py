@@ -1,6 +1,7 @@
 from enum import Enum
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
+from uuid import UUID
 
 class IssueStatus(str, Enum):
     OPEN = "open"
@@ -25,10 +26,13 @@ class IssueUpdate(BaseModel):
     status: Optional[IssueStatus] = None
     priority: Optional[IssuePriority] = None
 
+class IssueBatchRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=100)
+
 class IssueResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
-    id: str
+    id: UUID
     title: str
     description: str
     status: IssueStatus
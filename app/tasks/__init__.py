@@ -1,7 +1,7 @@
 """Background tasks module.
 
-This module contains both Celery tasks (long-running, async jobs) and 
-FastAPI BackgroundTasks (quick, fire-and-forget operations).
+This module contains the Celery tasks (long-running, async jobs) and the
+outbound notification senders they call.
 
 Celery tasks: Use for operations that take significant time
 - Long API calls
@@ -9,10 +9,9 @@ Celery tasks: Use for operations that take significant time
 - Machine learning/LLM calls
 - File processing
 
-BackgroundTasks: Use for quick operations that don't block the request
-- Notifications
-- Logging
-- Cache invalidation
+Notifications: Async senders for outbound messages
+- Slack notification on issue creation, sent by the notify_enriched task
+  once enrich_issue has finished
 
 IMPORTANT: Import notifications directly here, but import celery_tasks
 explicitly when needed to avoid circular imports with Celery initialization.
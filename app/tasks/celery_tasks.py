@@ -2,15 +2,75 @@
 
 import logging
 import asyncio
+from typing import Optional
 
+import httpx
+import sqlalchemy.exc
+from sqlalchemy import bindparam, select, update
+
+from app.cache import invalidate_issues
 from app.database import models
-from app.database.config import SyncSessionLocal
-from app.celery_app import app
+from app.database.config import AsyncSessionLocal
+from app.celery_app import app, get_http_client, run_async
 
-from app.llm_service import get_llm_service, LLMServiceError
+from app.llm_cache import LLMCache
+from app.llm_service import get_llm_service, LLMService, LLMServiceError
+from app.tasks.notifications import notify_issue_creation
 
 logger = logging.getLogger(__name__)
 
+# Exact-match cache of LLM answers, shared by all tasks in this worker process
+_LLM_CACHE = LLMCache()
+
+# Single-issue statements, built once and reused with bound parameters
+_GET_ISSUE_TEXT_STMT = select(
+    models.Issue.title,
+    models.Issue.description,
+    models.Issue.priority,
+    models.Issue.ai_summary,
+    models.Issue.tags,
+).where(models.Issue.id == bindparam("issue_id"))
+# Only fills in issues that are not enriched yet, so a redelivered task is a no-op
+_SAVE_ENRICHMENT_STMT = (
+    update(models.Issue.__table__)
+    .where(models.Issue.id == bindparam("issue_id"), models.Issue.ai_summary.is_(None))
+    .values(ai_summary=bindparam("ai_summary"), tags=bindparam("tags"))
+)
+
+# Shared by the enrichment tasks. Tasks are acked only after they finish and
+# requeued if the worker process dies mid-task. LLM failures already fall back
+# to keyword tags and cache failures count as misses inside the task, so only
+# transient database and network errors are retried; bugs fail immediately.
+ENRICH_TASK_OPTIONS = dict(
+    acks_late=True,
+    reject_on_worker_lost=True,
+    autoretry_for=(
+        sqlalchemy.exc.OperationalError,
+        sqlalchemy.exc.InterfaceError,
+        sqlalchemy.exc.TimeoutError,  # Connection pool exhausted
+        OSError,
+    ),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=3,
+)
+
+# Maximum number of issues sent to the LLM in one batched prompt
+LLM_BATCH_SIZE = 16
+
+# Fallback tags in output order, with the keywords that trigger each.
+# Keywords match anywhere in the text, as plain substrings.
+FALLBACK_TAG_KEYWORDS = {
+    "bug": ("bug", "error", "broken", "crash", "issue", "fail"),
+    "feature-request": ("feature", "enhancement", "request", "new", "add"),
+    "urgent": ("urgent", "critical", "asap", "immediately", "blocking"),
+    "frontend": ("frontend", "ui", "ux", "button", "modal", "form"),
+    "backend": ("backend", "api", "endpoint", "database", "server"),
+    "performance": ("slow", "performance", "optimization", "lag", "delay"),
+}
+
+
 def _get_fallback_summary(title: str, description: str) -> str:
     """
     Generate fallback summary if LLM is unavailable or fails.
@@ -28,33 +88,239 @@ def _get_fallback_tags(title: str, description: str) -> list[str]:
     """
     keywords = ["needs-review"]
     text_lower = f"{title} {description}".lower()
-    
-    # Bug indicators
-    if any(word in text_lower for word in ["bug", "error", "broken", "crash", "issue", "fail"]):
-        keywords.append("bug")
-    
-    # Feature indicators
-    if any(word in text_lower for word in ["feature", "enhancement", "request", "new", "add"]):
-        keywords.append("feature-request")
-    
-    # Priority indicators
-    if any(word in text_lower for word in ["urgent", "critical", "asap", "immediately", "blocking"]):
-        keywords.append("urgent")
-    
-    # Component indicators
-    if any(word in text_lower for word in ["frontend", "ui", "ux", "button", "modal", "form"]):
-        keywords.append("frontend")
-    
-    if any(word in text_lower for word in ["backend", "api", "endpoint", "database", "server"]):
-        keywords.append("backend")
-    
-    # Performance indicators
-    if any(word in text_lower for word in ["slow", "performance", "optimization", "lag", "delay"]):
-        keywords.append("performance")
-    
+
+    for tag, words in FALLBACK_TAG_KEYWORDS.items():
+        for word in words:
+            if word in text_lower:
+                keywords.append(tag)
+                break
+
     return keywords
 
-@app.task(bind=True, max_retries=3, default_retry_delay=60)
+
+def _get_fallback_fields(title: str, description: str) -> tuple[str, str]:
+    """Return fallback (ai_summary, tags) for an issue."""
+    return (
+        _get_fallback_summary(title, description),
+        ",".join(_get_fallback_tags(title, description)),
+    )
+
+
+async def _enrich_fields(
+    llm_service: Optional[LLMService], issue_id: str, title: str, description: str
+) -> tuple[str, str]:
+    """
+    Build the AI summary and comma-separated tags for a single issue.
+
+    Uses the LLM when one is configured, answering duplicate issues from the
+    LLM cache, and falls back to keyword detection if it is unavailable or fails.
+
+    Returns:
+        Tuple of (ai_summary, tags)
+    """
+    if llm_service:
+        cache_key = LLMCache.cache_key(llm_service.model, title, description)
+        cached = await _LLM_CACHE.get(cache_key)
+
+        if cached:
+            logger.info(
+                f"LLM cache hit for issue {issue_id}",
+                extra={
+                    "issue_id": issue_id,
+                    "llm_cache_hits": _LLM_CACHE.hits,
+                    "llm_cache_misses": _LLM_CACHE.misses
+                }
+            )
+            return cached.summary, ",".join(cached.tags)
+
+        try:
+            enrichment = await llm_service.enrich(title, description)
+            await _LLM_CACHE.set(cache_key, enrichment)
+
+            logger.info(
+                f"LLM enrichment succeeded for issue {issue_id}",
+                extra={
+                    "issue_id": issue_id,
+                    "tags_count": len(enrichment.tags),
+                    "summary_length": len(enrichment.summary)
+                }
+            )
+            return enrichment.summary, ",".join(enrichment.tags)
+        except LLMServiceError as e:
+            logger.warning(
+                f"LLM enrichment failed, using fallback: {str(e)}",
+                extra={"issue_id": issue_id}
+            )
+    else:
+        # No LLM configured, use fallback
+        logger.info(
+            "No LLM service configured, using fallback enrichment",
+            extra={"issue_id": issue_id}
+        )
+
+    return _get_fallback_fields(title, description)
+
+
+async def _enrich_many(llm_service: Optional[LLMService], rows) -> list[tuple[str, str]]:
+    """
+    Build AI summaries and tags for several issues.
+
+    Issues found in the LLM cache are answered from it. The rest are sent to
+    the LLM in batched prompts of up to LLM_BATCH_SIZE issues, with the
+    batches running concurrently. A failed batch falls back to keyword
+    detection for its issues.
+
+    Returns:
+        List of (ai_summary, tags) tuples, in the same order as rows
+    """
+    if not llm_service:
+        return await asyncio.gather(
+            *(_enrich_fields(None, str(row.id), row.title, row.description) for row in rows)
+        )
+
+    keys = [LLMCache.cache_key(llm_service.model, row.title, row.description) for row in rows]
+    cached = await asyncio.gather(*(_LLM_CACHE.get(key) for key in keys))
+
+    results: dict[int, tuple[str, str]] = {}
+    pending: list[int] = []
+    for index, hit in enumerate(cached):
+        if hit:
+            results[index] = (hit.summary, ",".join(hit.tags))
+        else:
+            pending.append(index)
+
+    async def enrich_batch(batch: list[int]) -> None:
+        try:
+            enrichments = await llm_service.enrich_many(
+                [(rows[index].title, rows[index].description) for index in batch]
+            )
+        except LLMServiceError as e:
+            logger.warning(
+                f"Batched LLM enrichment failed, using fallback: {str(e)}",
+                extra={"issue_ids": [str(rows[index].id) for index in batch]}
+            )
+            for index in batch:
+                results[index] = _get_fallback_fields(rows[index].title, rows[index].description)
+            return
+
+        for index, enrichment in zip(batch, enrichments):
+            results[index] = (enrichment.summary, ",".join(enrichment.tags))
+            await _LLM_CACHE.set(keys[index], enrichment)
+
+    await asyncio.gather(
+        *(
+            enrich_batch(pending[start:start + LLM_BATCH_SIZE])
+            for start in range(0, len(pending), LLM_BATCH_SIZE)
+        )
+    )
+
+    logger.info(
+        f"Enriched {len(rows)} issues, {len(rows) - len(pending)} from the LLM cache",
+        extra={"llm_cache_hits": _LLM_CACHE.hits, "llm_cache_misses": _LLM_CACHE.misses}
+    )
+    return [results[index] for index in range(len(rows))]
+
+
+def _notification_fields(issue_id: str, issue, tags: Optional[str]) -> dict:
+    """Fields notify_enriched needs to post the Slack message for an issue."""
+    return {
+        "issue_id": issue_id,
+        "title": issue.title,
+        "priority": issue.priority,
+        "description": issue.description,
+        "tags": tags,
+    }
+
+
+async def _enrich_issue(issue_id: str) -> Optional[dict]:
+    """
+    Load one issue, enrich it and save the result.
+
+    Returns:
+        The enriched issue's fields for notify_enriched, also when an earlier
+        delivery of this task already enriched it. None if the issue is
+        missing or another task is enriching it concurrently.
+    """
+    async with AsyncSessionLocal() as db:
+        # Plain row tuple, no ORM instance to hydrate or flush
+        result = await db.execute(_GET_ISSUE_TEXT_STMT, {"issue_id": issue_id})
+        issue = result.first()
+
+        if not issue:
+            logger.warning(f"Issue {issue_id} not found for enrichment")
+            return None
+
+        if issue.ai_summary is not None:
+            # A redelivered task (e.g. the worker died after the UPDATE
+            # committed) still hands the issue on to notify_enriched
+            logger.info(f"Issue {issue_id} is already enriched", extra={"issue_id": issue_id})
+            return _notification_fields(issue_id, issue, issue.tags)
+
+        logger.info(
+            f"Starting enrichment for issue {issue_id}", extra={"issue_id": issue_id, "title": issue.title}
+        )
+
+        #  Get LLM service if configured
+        llm_service = get_llm_service(http_client=get_http_client())
+
+        summary, tags = await _enrich_fields(
+            llm_service, issue_id, issue.title, issue.description
+        )
+
+        # Save enrichment with a single UPDATE ... WHERE id = :issue_id
+        result = await db.execute(
+            _SAVE_ENRICHMENT_STMT, {"issue_id": issue_id, "ai_summary": summary, "tags": tags}
+        )
+        await db.commit()
+
+        if result.rowcount == 0:
+            logger.info(f"Issue {issue_id} was enriched concurrently", extra={"issue_id": issue_id})
+            return None
+
+    await invalidate_issues(issue_id)
+    logger.info(
+        f"Successfully enriched issue {issue_id}",
+        extra={"issue_id": issue_id}
+    )
+    return _notification_fields(issue_id, issue, tags)
+
+
+async def _enrich_issues_batch(issue_ids: list[str]) -> None:
+    """Load several issues, enrich them concurrently and save all results."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(models.Issue.id, models.Issue.title, models.Issue.description)
+            .where(models.Issue.id.in_(issue_ids), models.Issue.ai_summary.is_(None))
+        )
+        rows = result.all()
+
+        if not rows:
+            logger.warning(f"None of the {len(issue_ids)} issues were found unenriched")
+            return
+
+        logger.info(f"Starting batch enrichment for {len(rows)} issues")
+
+        llm_service = get_llm_service(http_client=get_http_client())
+        results = await _enrich_many(llm_service, rows)
+
+        # ORM bulk UPDATE by primary key, sent as a single executemany. The
+        # extra criteria skip issues another task enriched in the meantime
+        await db.execute(
+            update(models.Issue)
+            .where(models.Issue.ai_summary.is_(None))
+            .execution_options(synchronize_session=None),
+            [
+                {"id": row.id, "ai_summary": summary, "tags": tags}
+                for row, (summary, tags) in zip(rows, results)
+            ],
+        )
+        await db.commit()
+
+    await invalidate_issues(*(row.id for row in rows))
+    logger.info(f"Successfully enriched {len(rows)} issues")
+
+
+@app.task(bind=True, **ENRICH_TASK_OPTIONS)
 def enrich_issue(self, issue_id: str):
     """
     Enrich an issue with AI-generated summary and tags using an LLM
@@ -71,87 +337,97 @@ def enrich_issue(self, issue_id: str):
     Args: 
         issue_id: The UUID of the issue to enrich
 
+    Returns:
+        The enriched issue's fields, passed on to notify_enriched when the
+        task is chained, or None if there is nothing to notify about
+
     Raises:
-        self.retry(): Retries up to 3 times with increasing delay
+        OperationalError, InterfaceError, TimeoutError, OSError: Retried
+            up to 3 times with jittered exponential backoff; any other
+            exception fails the task
 
     Logs: 
         - INFO: Task progress and completion
         - WARNING: Fallback use or LLM failures
         - ERROR: Unexpected errors
     """
-    db = SyncSessionLocal()
-    
     try:
-        # Fetch issue from database
-        issue = db.query(models.Issue).filter(models.Issue.id == issue_id).first()
-        
-        if not issue:
-            logger.warning(f"Issue {issue_id} not found for enrichment")
-            return
-        
-        logger.info(
-            f"Starting enrichment for issue {issue_id}", extra={"issue_id": issue_id, "title": issue.title}
-        )
-
-        #  Get LLM service if configured
-        llm_service = get_llm_service()
-
-        if llm_service:
-            try:
-                enrichment = asyncio.run(
-                    llm_service.enrich(issue.title, issue.description)
-                )
-
-                issue.ai_summary = enrichment.summary
-                issue.tags = ",".join(enrichment.tags)
-
-                logger.info(
-                    f"LLM enrichment succeeded for issue {issue_id}",
-                    extra={
-                        "issue_id": issue_id,
-                        "tags_count": len(enrichment.tags),
-                        "summary_length": len(enrichment.summary)
-                    }
-                )
-            except LLMServiceError as e:
-                logger.warning(
-                    f"LLM enrichment failed, using fallback: {str(e)}",
-                    extra={"issue_id": issue_id}
-                )
-                issue.ai_summary = _get_fallback_summary(issue.title, issue.description)
-                issue.tags = ",".join(_get_fallback_tags(issue.title, issue.description))
-            
-        else: 
-            # No LLM configured, use fallback
-            logger.info(
-                "No LLM service configured, using fallback enrichment",
-                extra={"issue_id": issue_id}
-            )
-            issue.ai_summary = _get_fallback_summary(issue.title, issue.description)
-            issue.tags = ",".join(_get_fallback_tags(issue.title, issue.description))
+        return run_async(_enrich_issue(issue_id))
 
-        # Save enrichment issue to database
-        db.commit()
-        logger.info(
-            f"Successfully enriched issue {issue_id}",
-            extra={
-                "issue_id": {issue_id}
-            }
-        )
-    
     except Exception as exc: 
-        db.rollback()
         logger.error(
             f"Error enriching issue {issue_id}: {str(exc)}",
             extra={"issue_id": issue_id},
             exc_info=True
         )
 
-        # Rety with exponential backoff
-        # Delay: 60s, 120s, 180s for retries 1, 2, 3
-        countdown = 60 * (self.request.retries + 1)
-        raise self.retry(exec=exc, countdown=countdown) 
-    
-    finally: 
-        db.close()
+        raise
+
+
+@app.task(bind=True, **ENRICH_TASK_OPTIONS)
+def enrich_issues_batch(self, issue_ids: list[str]):
+    """
+    Enrich many issues in one task, e.g. after a bulk import.
+
+    Loads all issues with a single SELECT ... WHERE id IN (...), enriches
+    them with batched LLM prompts on the worker's event loop and writes all
+    results back with one executemany UPDATE.
+
+    Args:
+        issue_ids: The UUIDs of the issues to enrich
+
+    Raises:
+        OperationalError, InterfaceError, TimeoutError, OSError: Retried
+            up to 3 times with jittered exponential backoff; any other
+            exception fails the task
+    """
+    try:
+        run_async(_enrich_issues_batch(issue_ids))
+
+    except Exception as exc:
+        logger.error(
+            f"Error enriching issue batch: {str(exc)}",
+            extra={"issue_ids": issue_ids},
+            exc_info=True
+        )
+
+        raise
+
+
+@app.task(
+    ignore_result=True,
+    acks_late=True,
+    autoretry_for=(httpx.HTTPError,),
+    retry_backoff=True,
+    retry_jitter=True,
+    max_retries=5,
+)
+def notify_enriched(issue: Optional[dict]):
+    """
+    Send the Slack notification for a newly created issue.
+
+    Chained after enrich_issue and receives its return value, so the message
+    carries the AI tags and needs no database query. Runs on the
+    notifications queue, off the web process, and retries failed posts.
+
+    Delivery is at least once per created issue: if enrich_issue fails for
+    good, its error callback runs this task with the fields known at
+    creation and no tags. A worker lost between queueing this task and
+    acking enrich_issue can cause a duplicate message. Nothing is sent for
+    an issue deleted before enrichment, or after the last failed post.
+
+    Args:
+        issue: Fields of the issue, None if there is nothing to notify about
+
+    Raises:
+        httpx.HTTPError: Retried up to 5 times with jittered exponential backoff
+    """
+    if issue is None:
+        return
+
+    run_async(notify_issue_creation(issue))
+
 
+# task_routes and the workers look tasks up by name; fail at import if the task
+# was redefined or registered under a different module path
+assert enrich_issue.name == "app.tasks.celery_tasks.enrich_issue", enrich_issue.name
@@ -1,32 +1,26 @@
-"""Non-Celery background tasks for notifications and outbound communications."""
+"""Outbound notifications, sent from Celery tasks once an issue is enriched."""
 
 import logging
 import os
+from typing import Optional
 
 import httpx
-
-from app.database import models
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive HTTP/2 client, so notifications reuse the connection to
+# Slack instead of opening a new TCP and TLS session per issue
+_CLIENT = httpx.AsyncClient(
+    timeout=5.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
 
-def notify_issue_creation(issue: models.Issue) -> None:
-    """Send a Slack notification when a new issue is created.
-    
-    This is a FastAPI BackgroundTask (not Celery), suitable for quick,
-    synchronous operations that should not block the main request.
-    
-    Args:
-        issue: The Issue model instance to notify about
-    """
-    slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
-    if not slack_webhook_url:
-        logger.warning("SLACK_WEBHOOK_URL not set, skipping notification")
-        return
-
-    logger.info("Issue created", extra={"issue_id": issue.id})
-
-    payload = {
+# Slack message blocks, serialized once at import. The quoted placeholders are
+# swapped for the JSON-encoded issue fields on each notification.
+_SLACK_TEMPLATE = orjson.dumps(
+    {
         "blocks": [
             {
                 "type": "header",
@@ -38,38 +32,75 @@ def notify_issue_creation(issue: models.Issue) -> None:
             {
                 "type": "section",
                 "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Title:*\n{issue.title}",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Priority:*\n{issue.priority}",
-                    },
+                    {"type": "mrkdwn", "text": "$title"},
+                    {"type": "mrkdwn", "text": "$priority"},
+                    {"type": "mrkdwn", "text": "$tags"},
                 ],
             },
             {
                 "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Description:*\n{issue.description or '_No description provided_'}",
-                },
+                "text": {"type": "mrkdwn", "text": "$description"},
             },
         ]
     }
+)
+
+
+async def close_notification_client() -> None:
+    """Close the shared notification HTTP client. Call once on shutdown."""
+    await _CLIENT.aclose()
+
+
+async def notify_issue_creation(
+    issue: dict, http_client: Optional[httpx.AsyncClient] = None
+) -> None:
+    """Send a Slack notification when a new issue is created.
+    
+    Called by the notify_enriched Celery task with the fields returned by
+    enrich_issue, so the message includes the AI tags without re-reading the
+    issue from the database.
+    
+    Args:
+        issue: issue_id, title, priority, description and tags of the issue,
+            tags is None if enrichment failed
+        http_client: Client to send with, defaults to the shared client
+
+    Raises:
+        httpx.HTTPError: If Slack could not be reached or rejected the message
+    """
+    slack_webhook_url = os.environ.get("SLACK_WEBHOOK_URL")
+    if not slack_webhook_url:
+        logger.warning("SLACK_WEBHOOK_URL not set, skipping notification")
+        return
+
+    logger.info("Issue created", extra={"issue_id": issue["issue_id"]})
+
+    body = (
+        _SLACK_TEMPLATE
+        .replace(b'"$title"', orjson.dumps(f"*Title:*\n{issue['title']}"), 1)
+        .replace(b'"$priority"', orjson.dumps(f"*Priority:*\n{issue['priority']}"), 1)
+        .replace(b'"$tags"', orjson.dumps(f"*Tags:*\n{issue['tags'] or '_Not enriched_'}"), 1)
+        .replace(
+            b'"$description"',
+            orjson.dumps(f"*Description:*\n{issue['description'] or '_No description provided_'}"),
+            1,
+        )
+    )
 
     try:
-        with httpx.Client(timeout=5.0) as client:
-            response = client.post(slack_webhook_url, json=payload)
-            response.raise_for_status()
+        response = await (http_client or _CLIENT).post(
+            slack_webhook_url, content=body, headers={"Content-Type": "application/json"}
+        )
+        response.raise_for_status()
 
         logger.info(
             "Slack notification sent successfully",
-            extra={"issue_id": issue.id},
+            extra={"issue_id": issue["issue_id"]},
         )
 
     except httpx.HTTPError:
         logger.exception(
             "Failed to send Slack notification",
-            extra={"issue_id": issue.id},
+            extra={"issue_id": issue["issue_id"]},
         )
+        raise
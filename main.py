@@ -1,12 +1,16 @@
 import logging
+import os
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database.config import engine, Base
+from app.database.config import engine, init_db
+from app.cache import close_cache
+from app.llm_service import close_http_client
 from app.middleware.timing import timing_middleware
 from app.routes.issues import router as issues_router
+from app.tasks.notifications import close_notification_client
 from contextlib import asynccontextmanager
 
 from app.database import models  # noqa: F401
@@ -16,13 +20,17 @@ load_dotenv()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Startup: Create tables in development only. Production schemas are
+    # managed by Alembic at deploy time, so workers boot without catalog queries
+    if os.getenv("AUTO_CREATE_SCHEMA") == "1":
+        await init_db()
     
     yield
     
-    # Shutdown: Dispose of the engine
+    # Shutdown: Close shared LLM/Slack/cache clients and dispose of the engine
+    await close_http_client()
+    await close_notification_client()
+    await close_cache()
     await engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
@@ -0,0 +1,46 @@
+"""Initial issues schema
+
+The table as Base.metadata.create_all() created it before the column
+types were compacted. Databases created that way are already at this
+revision: run `alembic stamp 0001` once, then `alembic upgrade head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "issues",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("title", sa.String()),
+        sa.Column("description", sa.String()),
+        sa.Column("status", postgresql.ENUM("open", "closed", name="issue_status")),
+        sa.Column("priority", postgresql.ENUM("low", "medium", "high", name="issue_priority")),
+        sa.Column("ai_summary", sa.String(), nullable=True),
+        sa.Column("tags", sa.String(), nullable=True),
+    )
+    op.create_index("ix_issues_id", "issues", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_issues_id", table_name="issues")
+    op.drop_table("issues")
+    op.execute("DROP TYPE IF EXISTS issue_priority")
+    op.execute("DROP TYPE IF EXISTS issue_status")
@@ -0,0 +1,109 @@
+"""Compact issue columns and add status indexes
+
+Converts issues.id from VARCHAR to UUID and status/priority from PG ENUM
+to SMALLINT codes (see SmallIntEnum in app/database/models.py), drops the
+index that duplicated the primary key and creates the status indexes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# SMALLINT codes at this revision: IssueStatus / IssuePriority members in
+# declaration order. Kept as literals so later enum changes do not alter
+# what this migration does.
+STATUS_VALUES = ["open", "in_progress", "resolved", "closed"]
+PRIORITY_VALUES = ["low", "medium", "high", "critical"]
+# Values the PG ENUM types of revision 0001 can hold
+OLD_STATUS_VALUES = ["open", "closed"]
+OLD_PRIORITY_VALUES = ["low", "medium", "high"]
+
+
+def _to_code(column: str, values: list[str]) -> str:
+    """SQL CASE expression mapping an enum column's text to its SMALLINT code."""
+    whens = " ".join(f"WHEN '{value}' THEN {code}" for code, value in enumerate(values))
+    return f"CASE {column}::text {whens} END"
+
+
+def _to_value(column: str, values: list[str], enum_type: str) -> str:
+    """SQL CASE expression mapping a SMALLINT code back to the enum type."""
+    whens = " ".join(f"WHEN {code} THEN '{value}'" for code, value in enumerate(values))
+    return f"(CASE {column} {whens} END)::{enum_type}"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index("ix_issues_id", table_name="issues")
+    op.alter_column(
+        "issues", "id",
+        type_=sa.Uuid(),
+        postgresql_using="id::uuid",
+    )
+    op.alter_column(
+        "issues", "status",
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_code("status", STATUS_VALUES),
+    )
+    op.alter_column(
+        "issues", "priority",
+        type_=sa.SmallInteger(),
+        postgresql_using=_to_code("priority", PRIORITY_VALUES),
+    )
+    op.execute("DROP TYPE issue_status")
+    op.execute("DROP TYPE issue_priority")
+
+    op.create_index("ix_issues_status", "issues", ["status"])
+    op.create_index(
+        "ix_issues_open",
+        "issues",
+        ["id"],
+        postgresql_where=sa.text(f"status = {STATUS_VALUES.index('open')}"),
+        postgresql_include=["title", "priority"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Fails if any issue has a status or priority the old ENUM types cannot
+    hold (e.g. in_progress or critical).
+    """
+    op.drop_index("ix_issues_open", table_name="issues")
+    op.drop_index("ix_issues_status", table_name="issues")
+
+    op.execute(
+        "CREATE TYPE issue_status AS ENUM ("
+        + ", ".join(f"'{value}'" for value in OLD_STATUS_VALUES) + ")"
+    )
+    op.execute(
+        "CREATE TYPE issue_priority AS ENUM ("
+        + ", ".join(f"'{value}'" for value in OLD_PRIORITY_VALUES) + ")"
+    )
+    op.alter_column(
+        "issues", "status",
+        type_=sa.Enum(*OLD_STATUS_VALUES, name="issue_status", create_type=False),
+        postgresql_using=_to_value("status", STATUS_VALUES, "issue_status"),
+    )
+    op.alter_column(
+        "issues", "priority",
+        type_=sa.Enum(*OLD_PRIORITY_VALUES, name="issue_priority", create_type=False),
+        postgresql_using=_to_value("priority", PRIORITY_VALUES, "issue_priority"),
+    )
+    op.alter_column(
+        "issues", "id",
+        type_=sa.String(),
+        postgresql_using="id::text",
+    )
+    op.create_index("ix_issues_id", "issues", ["id"])
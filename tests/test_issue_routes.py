@@ -0,0 +1,62 @@
+"""Tests for the issue API routes."""
+
+import uuid
+
+from asyncpg.pgproto.pgproto import UUID as AsyncpgUUID
+from fastapi.testclient import TestClient
+
+import main
+import app.routes.issues as issue_routes
+from app.database.config import get_db
+
+
+class _FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Stands in for AsyncSession, returning rows as asyncpg would."""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    async def execute(self, statement, params=None):
+        return _FakeResult(self._rows)
+
+
+def test_list_issues_serializes_asyncpg_uuids(monkeypatch):
+    issue_id = uuid.uuid4()
+    row = {
+        # asyncpg hands back its own UUID type, not uuid.UUID
+        "id": AsyncpgUUID(issue_id.bytes),
+        "title": "Crash on login",
+        "description": "The login page crashes",
+        "status": "open",
+        "priority": "high",
+        "ai_summary": None,
+        "tags": None,
+    }
+
+    async def fake_db():
+        yield _FakeSession([row])
+
+    async def cache_miss(key):
+        return None
+
+    async def cache_set(key, value, ttl=None):
+        pass
+
+    monkeypatch.setattr(issue_routes, "get_cached", cache_miss)
+    monkeypatch.setattr(issue_routes, "set_cached", cache_set)
+    main.app.dependency_overrides[get_db] = fake_db
+    try:
+        response = TestClient(main.app).get("/api/v1/issues/")
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == [{**row, "id": str(issue_id)}]
@@ -0,0 +1,44 @@
+"""Tests for the LLM enrichment cache."""
+
+import asyncio
+
+import orjson
+import pytest
+
+import app.llm_cache as llm_cache
+from app.llm_cache import LLMCache
+from app.llm_service import EnrichmentResult
+
+
+def _get_with_cached_value(monkeypatch, value):
+    async def get_cached(key):
+        return value
+
+    monkeypatch.setattr(llm_cache, "get_cached", get_cached)
+    cache = LLMCache()
+    return cache, asyncio.run(cache.get("llm:key"))
+
+
+def test_get_returns_cached_enrichment(monkeypatch):
+    cache, result = _get_with_cached_value(
+        monkeypatch, orjson.dumps({"summary": "Login crashes.", "tags": ["bug"]})
+    )
+
+    assert result == EnrichmentResult(summary="Login crashes.", tags=["bug"])
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        b"not json",
+        b"[1, 2]",
+        b'{"summary": "Login crashes."}',
+        b'{"summary": "Login crashes.", "tags": "bug", "extra": 1}',
+    ],
+)
+def test_get_treats_malformed_entry_as_miss(monkeypatch, value):
+    cache, result = _get_with_cached_value(monkeypatch, value)
+
+    assert result is None
+    assert (cache.hits, cache.misses) == (0, 1)
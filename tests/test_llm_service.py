@@ -0,0 +1,76 @@
+"""Tests for validating LLM answers before they are used or cached."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import app.llm_cache as llm_cache
+import app.tasks.celery_tasks as celery_tasks
+from app.llm_cache import LLMCache
+from app.llm_service import EnrichmentResult, LLMServiceError, OpenAIService
+
+
+def _service_answering(content: str) -> OpenAIService:
+    """Build an OpenAIService whose API streams back content as one chunk."""
+    chunk = orjson.dumps({"choices": [{"delta": {"content": content}}]}).decode()
+    body = f"data: {chunk}\n\ndata: [DONE]\n\n"
+
+    def handler(request):
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+
+    return OpenAIService("test-key", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+MALFORMED_ANSWERS = [
+    {"summary": "Login crashes.", "tags": "bug, ui"},
+    {"summary": "Login crashes.", "tags": [1, "bug"]},
+    {"summary": None, "tags": ["bug"]},
+    ["bug"],
+]
+
+
+def test_enrich_returns_well_formed_answer():
+    service = _service_answering('{"summary": "Login crashes.", "tags": ["bug", "ui/ux"]}')
+
+    result = asyncio.run(service.enrich("Login", "It crashes"))
+
+    assert result == EnrichmentResult(summary="Login crashes.", tags=["bug", "ui/ux"])
+
+
+@pytest.mark.parametrize("answer", MALFORMED_ANSWERS)
+def test_enrich_rejects_malformed_answer(answer):
+    service = _service_answering(orjson.dumps(answer).decode())
+
+    with pytest.raises(LLMServiceError):
+        asyncio.run(service.enrich("Login", "It crashes"))
+
+
+@pytest.mark.parametrize("answer", MALFORMED_ANSWERS[:3])
+def test_enrich_many_rejects_malformed_answer(answer):
+    answers = [{"id": 0, "summary": "Fine.", "tags": ["bug"]}, {"id": 1, **answer}]
+    service = _service_answering(orjson.dumps(answers).decode())
+
+    with pytest.raises(LLMServiceError):
+        asyncio.run(service.enrich_many([("Login", "It crashes"), ("Save", "It fails")]))
+
+
+def test_malformed_answer_uses_fallback_and_is_not_cached(monkeypatch):
+    stored = {}
+
+    async def get_cached(key):
+        return None
+
+    async def set_cached(key, value, ttl=None):
+        stored[key] = value
+
+    monkeypatch.setattr(llm_cache, "get_cached", get_cached)
+    monkeypatch.setattr(llm_cache, "set_cached", set_cached)
+    monkeypatch.setattr(celery_tasks, "_LLM_CACHE", LLMCache())
+    service = _service_answering('{"summary": "Login crashes.", "tags": [1, "bug"]}')
+
+    summary, tags = asyncio.run(celery_tasks._enrich_fields(service, "issue-1", "Login", "It crashes"))
+
+    assert (summary, tags) == celery_tasks._get_fallback_fields("Login", "It crashes")
+    assert stored == {}